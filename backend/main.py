@@ -1,35 +1,210 @@
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
+import msgspec
 import sqlite3
-import json
+import orjson
 import uuid
+import threading
+import queue
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from collections import OrderedDict, deque
+import re
+import hashlib
+import logging
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
 from pathlib import Path
 import os
 
+logger = logging.getLogger(__name__)
+
+# Initialize database, warm the read pool and start the writer on startup
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global WRITER
+    init_db()
+    load_seed_data()
+    open_read_pool()
+    WRITER = threading.Thread(target=run_writer, name="sqlite-writer", daemon=True)
+    WRITER.start()
+    yield
+    if WRITER.is_alive():
+        WRITE_QUEUE.put(None)
+        WRITER.join()
+    WRITER = None
+    close_read_pool()
+
 app = FastAPI(
     title="Campus Items API",
     description="REST API for managing campus items",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware. Every origin, method and header is allowed with
+# credentials, so the headers are fixed and precomputed instead of matched
+# per request. As with Starlette's CORSMiddleware, the request Origin is
+# echoed back (browsers refuse "*" with credentials) on preflights and on
+# requests that carry cookies.
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-credentials", b"true"),
+]
+CORS_CREDENTIALED_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+CORS_PREFLIGHT_HEADERS = CORS_CREDENTIALED_HEADERS + [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"86400"),
+    (b"content-length", b"0"),
+]
+
+class CORSHeadersMiddleware:
+    """Add the wildcard CORS headers to responses and answer preflights directly"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in request_headers:
+            headers = [(b"access-control-allow-origin", origin), *CORS_PREFLIGHT_HEADERS]
+            requested = request_headers.get(b"access-control-request-headers")
+            if requested:
+                headers.append((b"access-control-allow-headers", requested))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        if b"cookie" in request_headers:
+            cors_headers = [(b"access-control-allow-origin", origin), *CORS_CREDENTIALED_HEADERS]
+        else:
+            cors_headers = CORS_HEADERS
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *cors_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(CORSHeadersMiddleware)
+
+# Compress larger responses (the frontend page, item lists)
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
 # Database setup
 DB_PATH = "items.db"
 SEED_FILE = "data/seed.json"
 
+# Reads check a connection out of a bounded pool, opened and warmed on
+# startup. A connection has a single read snapshot while any of its cursors
+# is open, so each one serves one request at a time rather than being
+# shared across threads, which could serve rows from before a commit.
+READ_POOL = queue.Queue()
+READ_POOL_SIZE = min(8, (os.cpu_count() or 1) * 2)
+# SQLite serializes writers anyway, so all writes go through one writer
+# thread that commits whatever is queued as a single transaction
+WRITE_QUEUE = queue.Queue()
+WRITE_BATCH_MAX = 64
+# How long a request waits for its write to start before answering 503,
+# and then for a started write to finish
+WRITE_TIMEOUT = 10.0
+WRITE_RUNNING_TIMEOUT = 5.0
+WRITER = None
+
+class WriteError(Exception):
+    """Base for writes the writer thread couldn't report a result for"""
+    status_code = 500
+    code = "INTERNAL_ERROR"
+
+class WriteUnavailableError(WriteError):
+    """Raised when a write was not applied, so it is safe to retry"""
+    status_code = 503
+    code = "SERVICE_UNAVAILABLE"
+
+class WriteOutcomeUnknownError(WriteError):
+    """Raised when a started write still hasn't finished; it may commit"""
+    code = "WRITE_OUTCOME_UNKNOWN"
+
+# Item ids are handed out from a pool filled with one urandom read per batch
+ID_POOL = deque()
+ID_POOL_SIZE = 512
+ID_LOCK = threading.Lock()
+
+# LRU of serialized GET /api/v1/items/{id} bodies, keyed by item id. The
+# lock only guards the dict; misses query the database outside it. Every
+# invalidation bumps the generation, and a miss only caches its row if no
+# invalidation happened since it started, so a row read before a write
+# can't be cached after it.
+ITEM_CACHE = OrderedDict()
+ITEM_CACHE_MAX = 4096
+ITEM_CACHE_LOCK = threading.Lock()
+ITEM_CACHE_GENERATION = 0
+
+# SQL used by the endpoints. Kept as constants so the text is identical on
+# every call and the connection's statement cache always hits.
+SQL_LIST_ITEMS = """
+    SELECT id, title, source_name, publishedAt, url, summary, tags
+    FROM items
+    ORDER BY publishedAt DESC
+    LIMIT ? OFFSET ?
+"""
+SQL_GET_ITEM = """
+    SELECT id, title, source_name, publishedAt, url, summary, tags
+    FROM items
+    WHERE id = ?
+"""
+SQL_INSERT_ITEM = """
+    INSERT INTO items (id, title, source_name, publishedAt, url, summary, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_DELETE_ITEM = "DELETE FROM items WHERE id = ? RETURNING id"
+# One fixed statement for every PATCH shape: a NULL parameter keeps the
+# current value. RETURNING rows are read with fetchall() so the statement
+# always completes.
+SQL_UPDATE_ITEM = """
+    UPDATE items SET
+        title = COALESCE(?, title),
+        source_name = COALESCE(?, source_name),
+        publishedAt = COALESCE(?, publishedAt),
+        url = COALESCE(?, url),
+        summary = COALESCE(?, summary),
+        tags = COALESCE(?, tags)
+    WHERE id = ?
+    RETURNING id, title, source_name, publishedAt, url, summary, tags
+"""
+
+# publishedAt must be an ISO 8601 UTC datetime with a Z suffix
+ISO_Z_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?Z')
+PUBLISHED_AT_ERROR = 'publishedAt must be a valid UTC datetime string (ISO 8601 format with Z, e.g., 2025-03-01T09:00:00Z)'
+
+def is_valid_published_at(v: str) -> bool:
+    """Check the format with a precompiled regex, then the calendar date"""
+    if not ISO_Z_PATTERN.fullmatch(v):
+        return False
+    try:
+        datetime.fromisoformat(v[:-1])
+    except ValueError:
+        return False
+    return True
+
 # Pydantic Models
 class Source(BaseModel):
     name: str = Field(..., min_length=1)
@@ -45,36 +220,30 @@ class ItemInput(BaseModel):
     @field_validator('publishedAt')
     @classmethod
     def validate_datetime(cls, v):
-        try:
-            # Validate ISO 8601 datetime format
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-            # Ensure it ends with Z
-            if not v.endswith('Z'):
-                raise ValueError('Datetime must be in UTC with Z suffix')
-            return v
-        except Exception:
-            raise ValueError('publishedAt must be a valid UTC datetime string (ISO 8601 format with Z, e.g., 2025-03-01T09:00:00Z)')
-
-class ItemUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=1)
-    source: Optional[Source] = None
+        if not is_valid_published_at(v):
+            raise ValueError(PUBLISHED_AT_ERROR)
+        return v
+
+# Partial update payload. PATCH bodies are decoded straight into it with
+# msgspec, skipping Starlette's JSON parse and Pydantic validation.
+class SourceUpdate(msgspec.Struct):
+    name: Annotated[str, msgspec.Meta(min_length=1)]
+
+class ItemUpdate(msgspec.Struct, omit_defaults=True):
+    # Only decoded so a body that tries to change the id can be rejected
+    id: Any = msgspec.UNSET
+    title: Optional[Annotated[str, msgspec.Meta(min_length=1)]] = None
+    source: Optional[SourceUpdate] = None
     publishedAt: Optional[str] = None
-    url: Optional[str] = Field(None, min_length=1)
+    url: Optional[Annotated[str, msgspec.Meta(min_length=1)]] = None
     summary: Optional[str] = None
     tags: Optional[List[str]] = None
     
-    @field_validator('publishedAt')
-    @classmethod
-    def validate_datetime(cls, v):
-        if v is not None:
-            try:
-                datetime.fromisoformat(v.replace('Z', '+00:00'))
-                if not v.endswith('Z'):
-                    raise ValueError('Datetime must be in UTC with Z suffix')
-                return v
-            except Exception:
-                raise ValueError('publishedAt must be a valid UTC datetime string (ISO 8601 format with Z, e.g., 2025-03-01T09:00:00Z)')
-        return v
+    def __post_init__(self):
+        if self.publishedAt is not None and not is_valid_published_at(self.publishedAt):
+            raise ValueError(PUBLISHED_AT_ERROR)
+
+ITEM_UPDATE_DECODER = msgspec.json.Decoder(ItemUpdate)
 
 class Item(BaseModel):
     id: str
@@ -103,12 +272,165 @@ def init_db():
         )
     """)
     
+    # Covering index so list_items is an index scan with no sort step
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_items_pub
+        ON items (publishedAt DESC, id, title, source_name, url, summary, tags)
+    """)
+    
     conn.commit()
     conn.close()
 
+def get_connection():
+    """Open a long-lived connection tuned for concurrent reads and writes"""
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+def open_read_pool():
+    """Open and warm every pooled read connection"""
+    for _ in range(READ_POOL_SIZE):
+        conn = get_connection()
+        # Warm the connection so the first request doesn't pay for opening
+        # the file and loading the schema
+        conn.execute("SELECT 1 FROM items LIMIT 1").fetchall()
+        READ_POOL.put(conn)
+
+def close_read_pool():
+    """Close every pooled read connection, waiting for any still checked out"""
+    for _ in range(READ_POOL_SIZE):
+        READ_POOL.get().close()
+
+@contextmanager
+def read_connection():
+    """Check a read connection out of the pool for the duration of a request"""
+    conn = READ_POOL.get()
+    try:
+        yield conn
+    finally:
+        READ_POOL.put(conn)
+
+def execute_write(sql: str, params, item_id: Optional[str] = None) -> list:
+    """Queue a write for the writer thread and wait for its RETURNING rows"""
+    # The writer drops item_id's cached GET response once the write commits,
+    # so the cache stays correct even if this call times out first
+    if WRITER is None or not WRITER.is_alive():
+        raise WriteUnavailableError("Database writer is not running")
+    future = Future()
+    WRITE_QUEUE.put((sql, params, item_id, future))
+    try:
+        return future.result(timeout=WRITE_TIMEOUT)
+    except FutureTimeoutError:
+        # Only a write the writer hasn't picked up yet can be dropped and
+        # reported as unavailable
+        if future.cancel():
+            raise WriteUnavailableError("Timed out waiting for the database writer")
+    
+    # The write is already running, so wait for its real outcome
+    try:
+        return future.result(timeout=WRITE_RUNNING_TIMEOUT)
+    except FutureTimeoutError:
+        raise WriteOutcomeUnknownError("Write is still running; check the item before retrying")
+
+def fail_queued_writes(error: Exception):
+    """Fail every write still in the queue once the writer has stopped"""
+    while True:
+        try:
+            job = WRITE_QUEUE.get_nowait()
+        except queue.Empty:
+            return
+        if job is not None and job[3].set_running_or_notify_cancel():
+            job[3].set_exception(WriteUnavailableError(f"Database writer stopped: {error}"))
+
+def commit_batch(conn, batch):
+    """Run a batch of writes in one transaction and resolve their futures"""
+    results = []
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for sql, params, _, future in batch:
+            # Most failing statements (e.g. constraint errors) are rolled back
+            # on their own and the rest of the batch still commits
+            try:
+                results.append((future, conn.execute(sql, params).fetchall(), None))
+            except Exception as e:
+                if conn.in_transaction:
+                    results.append((future, None, e))
+                    continue
+                # Errors like SQLITE_FULL or IOERR roll back the whole
+                # transaction. Nothing in the batch was applied, so fail
+                # the lot instead of autocommitting the remaining writes.
+                for _, _, _, other in batch:
+                    if other is future:
+                        other.set_exception(e)
+                    else:
+                        other.set_exception(WriteUnavailableError(f"Write batch was rolled back: {e}"))
+                return
+        conn.execute("COMMIT")
+    except Exception as e:
+        for _, _, _, future in batch:
+            future.set_exception(e)
+        # If the rollback fails too the connection is unusable, so let the
+        # error stop the writer
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        return
+    
+    for _, _, item_id, _ in batch:
+        if item_id is not None:
+            invalidate_cached_item(item_id)
+    for future, rows, error in results:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(rows)
+
+def run_writer():
+    """Group-commit queued writes on a dedicated connection until stopped"""
+    conn = None
+    try:
+        conn = get_connection()
+        stopping = False
+        while not stopping:
+            job = WRITE_QUEUE.get()
+            if job is None:
+                break
+            
+            # Take whatever else queued up while the last batch was committing
+            batch = [job]
+            while len(batch) < WRITE_BATCH_MAX:
+                try:
+                    job = WRITE_QUEUE.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+            
+            # Skip writes whose caller already timed out
+            batch = [job for job in batch if job[3].set_running_or_notify_cancel()]
+            if batch:
+                commit_batch(conn, batch)
+    except Exception as e:
+        logger.exception("Database writer stopped")
+        fail_queued_writes(e)
+    finally:
+        if conn is not None:
+            conn.close()
+
 def load_seed_data():
     """Load seed data if database is empty"""
     conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
     
     # Check if database is empty
@@ -118,28 +440,55 @@ def load_seed_data():
     if count == 0:
         # Load seed data
         if os.path.exists(SEED_FILE):
-            with open(SEED_FILE, 'r') as f:
-                seed_items = json.load(f)
+            with open(SEED_FILE, 'rb') as f:
+                seed_items = orjson.loads(f.read())
             
-            for item in seed_items:
-                item_id = str(uuid.uuid4())
-                cursor.execute("""
-                    INSERT INTO items (id, title, source_name, publishedAt, url, summary, tags)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    item_id,
+            rows = [
+                (
+                    new_item_id(),
                     item['title'],
                     item['source']['name'],
                     item['publishedAt'],
                     item['url'],
                     item['summary'],
-                    json.dumps(item['tags'])
-                ))
+                    orjson.dumps(item['tags']).decode()
+                )
+                for item in seed_items
+            ]
             
-            conn.commit()
+            # Bind every row in one call inside a single transaction
+            with conn:
+                cursor.executemany(SQL_INSERT_ITEM, rows)
     
     conn.close()
 
+def new_item_id() -> str:
+    """Return a random UUID4 string, refilling the id pool when it runs out"""
+    with ID_LOCK:
+        if not ID_POOL:
+            blob = os.urandom(16 * ID_POOL_SIZE)
+            ID_POOL.extend(
+                str(uuid.UUID(bytes=blob[i:i + 16], version=4))
+                for i in range(0, len(blob), 16)
+            )
+        return ID_POOL.popleft()
+
+def cache_item(item_id: str, body: bytes, generation: int):
+    """Cache an item's GET response unless it was invalidated meanwhile"""
+    with ITEM_CACHE_LOCK:
+        if generation != ITEM_CACHE_GENERATION:
+            return
+        ITEM_CACHE[item_id] = body
+        if len(ITEM_CACHE) > ITEM_CACHE_MAX:
+            ITEM_CACHE.popitem(last=False)
+
+def invalidate_cached_item(item_id: str):
+    """Drop an item's cached GET response after it changes"""
+    global ITEM_CACHE_GENERATION
+    with ITEM_CACHE_LOCK:
+        ITEM_CACHE_GENERATION += 1
+        ITEM_CACHE.pop(item_id, None)
+
 def row_to_item(row) -> dict:
     """Convert database row to Item dict"""
     return {
@@ -149,61 +498,49 @@ def row_to_item(row) -> dict:
         "publishedAt": row[3],
         "url": row[4],
         "summary": row[5],
-        "tags": json.loads(row[6])
+        # tags is stored as JSON text, so embed it as-is instead of parsing
+        "tags": orjson.Fragment(row[6])
     }
 
-# Initialize database on startup
-@app.on_event("startup")
-async def startup_event():
-    init_db()
-    load_seed_data()
-
 # API Endpoints
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "ok"}
+    return ORJSONResponse({"status": "ok"})
 
 @app.get("/api/v1/items")
-async def list_items(
+def list_items(
     limit: int = Query(default=10, ge=1, le=20),
     offset: int = Query(default=0, ge=0)
 ):
     """List all items with pagination"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, title, source_name, publishedAt, url, summary, tags
-        FROM items
-        ORDER BY publishedAt DESC
-        LIMIT ? OFFSET ?
-    """, (limit, offset))
+    # Convert rows straight off the cursor rather than via fetchall(); the
+    # cursor is exhausted before the connection goes back to the pool
+    with read_connection() as conn:
+        cursor = conn.execute(SQL_LIST_ITEMS, (limit, offset))
+        items = [row_to_item(row) for row in cursor]
     
-    rows = cursor.fetchall()
-    conn.close()
-    
-    items = [row_to_item(row) for row in rows]
-    
-    return {"status": "ok", "data": items}
+    return ORJSONResponse({"status": "ok", "data": items})
 
 @app.get("/api/v1/items/{item_id}")
-async def get_item(item_id: str):
+def get_item(item_id: str):
     """Get a single item by ID"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, title, source_name, publishedAt, url, summary, tags
-        FROM items
-        WHERE id = ?
-    """, (item_id,))
-    
-    row = cursor.fetchone()
-    conn.close()
-    
-    if not row:
-        return JSONResponse(
+    with ITEM_CACHE_LOCK:
+        body = ITEM_CACHE.get(item_id)
+        if body is not None:
+            ITEM_CACHE.move_to_end(item_id)
+        generation = ITEM_CACHE_GENERATION
+    
+    if body is None:
+        # fetchall() finishes the statement before the connection is returned
+        with read_connection() as conn:
+            rows = conn.execute(SQL_GET_ITEM, (item_id,)).fetchall()
+        if rows:
+            body = orjson.dumps({"status": "ok", "data": row_to_item(rows[0])})
+            cache_item(item_id, body, generation)
+    
+    if body is None:
+        return ORJSONResponse(
             status_code=404,
             content={
                 "status": "error",
@@ -214,34 +551,24 @@ async def get_item(item_id: str):
             }
         )
     
-    item = row_to_item(row)
-    return {"status": "ok", "data": item}
+    return Response(body, media_type="application/json")
 
 @app.post("/api/v1/items", status_code=201)
-async def create_item(item: ItemInput):
+def create_item(item: ItemInput):
     """Create a new item"""
     try:
-        item_id = str(uuid.uuid4())
-        
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        item_id = new_item_id()
         
-        cursor.execute("""
-            INSERT INTO items (id, title, source_name, publishedAt, url, summary, tags)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        execute_write(SQL_INSERT_ITEM, (
             item_id,
             item.title,
             item.source.name,
             item.publishedAt,
             item.url,
             item.summary,
-            json.dumps(item.tags)
+            orjson.dumps(item.tags).decode()
         ))
         
-        conn.commit()
-        conn.close()
-        
         created_item = {
             "id": item_id,
             "title": item.title,
@@ -252,10 +579,22 @@ async def create_item(item: ItemInput):
             "tags": item.tags
         }
         
-        return {"status": "ok", "data": created_item}
+        return ORJSONResponse({"status": "ok", "data": created_item}, status_code=201)
+    
+    except WriteError as e:
+        return ORJSONResponse(
+            status_code=e.status_code,
+            content={
+                "status": "error",
+                "error": {
+                    "code": e.code,
+                    "message": str(e)
+                }
+            }
+        )
     
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "status": "error",
@@ -266,12 +605,35 @@ async def create_item(item: ItemInput):
             }
         )
 
-@app.patch("/api/v1/items/{item_id}")
-async def update_item(item_id: str, update_data: dict):
+@app.patch(
+    "/api/v1/items/{item_id}",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}}
+        }
+    }
+)
+async def update_item(item_id: str, request: Request):
     """Update an item (partial update)"""
+    # Decode and validate the body in one pass
+    try:
+        update = ITEM_UPDATE_DECODER.decode(await request.body())
+    except Exception as e:
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "status": "error",
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": str(e)
+                }
+            }
+        )
+    
     # Check if 'id' is in the request body
-    if 'id' in update_data:
-        return JSONResponse(
+    if update.id is not msgspec.UNSET:
+        return ORJSONResponse(
             status_code=400,
             content={
                 "status": "error",
@@ -282,33 +644,35 @@ async def update_item(item_id: str, update_data: dict):
             }
         )
     
-    # Validate the update data
+    # Absent fields are passed as NULL and keep their current value
+    params = (
+        update.title,
+        update.source.name if update.source is not None else None,
+        update.publishedAt,
+        update.url,
+        update.summary,
+        orjson.dumps(update.tags).decode() if update.tags is not None else None,
+        item_id
+    )
+    
+    # Update and read back the row in one statement (no row means no item),
+    # waiting for the blocking write in the threadpool
     try:
-        if update_data:
-            # Create a partial model for validation
-            ItemUpdate(**update_data)
-    except Exception as e:
-        return JSONResponse(
-            status_code=400,
+        rows = await run_in_threadpool(execute_write, SQL_UPDATE_ITEM, params, item_id)
+    except WriteError as e:
+        return ORJSONResponse(
+            status_code=e.status_code,
             content={
                 "status": "error",
                 "error": {
-                    "code": "VALIDATION_ERROR",
+                    "code": e.code,
                     "message": str(e)
                 }
             }
         )
     
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Check if item exists
-    cursor.execute("SELECT * FROM items WHERE id = ?", (item_id,))
-    row = cursor.fetchone()
-    
-    if not row:
-        conn.close()
-        return JSONResponse(
+    if not rows:
+        return ORJSONResponse(
             status_code=404,
             content={
                 "status": "error",
@@ -319,66 +683,29 @@ async def update_item(item_id: str, update_data: dict):
             }
         )
     
-    # Build update query
-    update_fields = []
-    update_values = []
-    
-    if 'title' in update_data:
-        update_fields.append("title = ?")
-        update_values.append(update_data['title'])
-    
-    if 'source' in update_data:
-        update_fields.append("source_name = ?")
-        update_values.append(update_data['source']['name'])
-    
-    if 'publishedAt' in update_data:
-        update_fields.append("publishedAt = ?")
-        update_values.append(update_data['publishedAt'])
-    
-    if 'url' in update_data:
-        update_fields.append("url = ?")
-        update_values.append(update_data['url'])
-    
-    if 'summary' in update_data:
-        update_fields.append("summary = ?")
-        update_values.append(update_data['summary'])
-    
-    if 'tags' in update_data:
-        update_fields.append("tags = ?")
-        update_values.append(json.dumps(update_data['tags']))
-    
-    if update_fields:
-        update_values.append(item_id)
-        query = f"UPDATE items SET {', '.join(update_fields)} WHERE id = ?"
-        cursor.execute(query, update_values)
-        conn.commit()
-    
-    # Fetch updated item
-    cursor.execute("""
-        SELECT id, title, source_name, publishedAt, url, summary, tags
-        FROM items
-        WHERE id = ?
-    """, (item_id,))
-    
-    row = cursor.fetchone()
-    conn.close()
-    
-    item = row_to_item(row)
-    return {"status": "ok", "data": item}
+    item = row_to_item(rows[0])
+    return ORJSONResponse({"status": "ok", "data": item})
 
 @app.delete("/api/v1/items/{item_id}", status_code=204)
-async def delete_item(item_id: str):
+def delete_item(item_id: str):
     """Delete an item"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Check if item exists
-    cursor.execute("SELECT id FROM items WHERE id = ?", (item_id,))
-    row = cursor.fetchone()
+    # Delete and check existence in one statement; no row means no item
+    try:
+        rows = execute_write(SQL_DELETE_ITEM, (item_id,), item_id)
+    except WriteError as e:
+        return ORJSONResponse(
+            status_code=e.status_code,
+            content={
+                "status": "error",
+                "error": {
+                    "code": e.code,
+                    "message": str(e)
+                }
+            }
+        )
     
-    if not row:
-        conn.close()
-        return JSONResponse(
+    if not rows:
+        return ORJSONResponse(
             status_code=404,
             content={
                 "status": "error",
@@ -389,17 +716,10 @@ async def delete_item(item_id: str):
             }
         )
     
-    cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
-    conn.commit()
-    conn.close()
-    
     return None
 
 # Frontend
-@app.get("/", response_class=HTMLResponse)
-async def frontend():
-    """Serve the frontend page"""
-    html_content = """
+FRONTEND_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -540,6 +860,29 @@ async def frontend():
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+
+# Encode the page and hash it once at import instead of on every request.
+# The ETag is weak because GZipMiddleware may send a different encoding
+# of the same page under it.
+FRONTEND_BYTES = FRONTEND_HTML.encode("utf-8")
+FRONTEND_OPAQUE_TAG = f'"{hashlib.md5(FRONTEND_BYTES).hexdigest()}"'
+FRONTEND_ETAG = f"W/{FRONTEND_OPAQUE_TAG}"
+FRONTEND_HEADERS = {"ETag": FRONTEND_ETAG, "Cache-Control": "public, max-age=3600"}
+
+def etag_matches(if_none_match: str) -> bool:
+    """Weakly compare an If-None-Match header against the frontend ETag"""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == FRONTEND_OPAQUE_TAG:
+            return True
+    return False
+
+@app.get("/", response_class=HTMLResponse)
+async def frontend(request: Request):
+    """Serve the frontend page"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match):
+        return Response(status_code=304, headers=FRONTEND_HEADERS)
+    return HTMLResponse(content=FRONTEND_BYTES, headers=FRONTEND_HEADERS)
 
 # Run with: uvicorn main:app --host 0.0.0.0 --port 8080
\ No newline at end of file